@@ -13,10 +13,13 @@ Supported Expressions:
 - Specific dates: 2024年1月1日, 1月15号
 """
 
+import functools
 import logging
 import re
-from calendar import monthrange
-from datetime import datetime, timedelta
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
@@ -25,19 +28,210 @@ from pydantic import BaseModel, Field
 logger = logging.getLogger(__name__)
 
 
-class ParsedTime(BaseModel):
-    """Parsed time result."""
+@functools.lru_cache(maxsize=1)
+def _load_zhdate():
+    """Import zhdate on first lunar conversion; None if not installed."""
+    try:
+        from zhdate import ZhDate
+    except ImportError:  # lunar conversion degrades gracefully without zhdate
+        return None
+    return ZhDate
 
-    value: Union[str, List[str]] = Field(
-        ...,
-        description="Parsed datetime string(s). Single string for point in time, list for range.",
-    )
-    is_range: bool = Field(default=False, description="Whether the result is a time range")
-    is_date_only: bool = Field(
-        default=False, description="Whether the result is date only (no time component)"
-    )
-    original_expression: str = Field(..., description="Original input expression")
-    confidence: float = Field(default=1.0, description="Confidence score (0-1) of the parsing")
+
+def __getattr__(name: str):
+    """Keep the lazily imported ZhDate reachable as a module attribute (PEP 562)."""
+    if name == "ZhDate":
+        return _load_zhdate()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=32)
+def _zone(name: str) -> ZoneInfo:
+    """Cached ZoneInfo lookup; the zone-file parse happens once per name."""
+    return ZoneInfo(name)
+
+# Holiday kind tags, interned so dispatch can use identity checks.
+_KIND_SOLAR = sys.intern("solar")
+_KIND_LUNAR = sys.intern("lunar")
+_KIND_QINGMING = sys.intern("qingming")
+
+_CN_DIGITS = "一二三四五六七八九"
+
+
+def _build_cn_num_table() -> dict:
+    """Build a flat lookup of every reachable numeral string (0-99) to its value."""
+    table = {str(i): i for i in range(100)}
+    table.update({"零": 0, "两": 2, "十": 10, "半": 0.5})
+    for i, tens in enumerate(_CN_DIGITS, start=1):
+        table[tens] = i
+        table["十" + tens] = 10 + i  # 十一..十九
+        table[tens + "十"] = i * 10  # 二十..九十
+        for j, ones in enumerate(_CN_DIGITS, start=1):
+            table[tens + "十" + ones] = i * 10 + j  # 二十一..九十九
+    return table
+
+
+_CN_NUM_TABLE = _build_cn_num_table()
+
+
+def _weekday_offset(week_offset: int, target_weekday: int, today_weekday: int) -> int:
+    """Day delta from today to the given weekday in the week shifted by week_offset."""
+    return target_weekday - today_weekday + week_offset * 7
+
+
+def _week_range_ords(today_ord: int, today_weekday: int, week_offset: int) -> Tuple[int, int]:
+    """(Monday, Sunday) ordinals of the week shifted by week_offset; pure integer math."""
+    monday = today_ord - today_weekday + week_offset * 7
+    return monday, monday + 6
+
+
+def _month_shift(year: int, month: int, offset: int) -> Tuple[int, int]:
+    """Shift (year, month) by a number of months, normalizing into 1-12."""
+    carry, month = divmod(month - 1 + offset, 12)
+    return year + carry, month + 1
+
+
+def _fmt_date(d: date) -> str:
+    """Format a date as YYYY-MM-DD; date.isoformat() runs in C."""
+    return d.isoformat()
+
+
+def _is_leap_year(year: int) -> bool:
+    """Check if a year is a leap year."""
+    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _last_day_of_month(year: int, month: int) -> int:
+    """Last day of a month; a table lookup instead of calendar.monthrange."""
+    if month == 2 and _is_leap_year(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+@functools.lru_cache(maxsize=512)
+def _lunar_to_solar_date(year: int, lunar_month: int, lunar_day: int) -> Optional[date]:
+    """
+    Convert a lunar (Chinese) date to a solar (Gregorian) date.
+
+    The mapping depends only on the integer inputs, so results are cached;
+    repeated lookups for the same holiday collapse to a dict hit.
+
+    Returns:
+        Naive date in the Gregorian calendar, or None if conversion fails
+        or zhdate is not installed.
+    """
+    ZhDate = _load_zhdate()
+    if ZhDate is None:
+        logger.warning("zhdate library not installed, lunar date conversion unavailable")
+        return None
+
+    try:
+        # Handle special case: 除夕 (lunar 12/30 or 12/29) - day before Spring Festival
+        if lunar_month == 12 and lunar_day >= 29:
+            solar_spring = ZhDate(year, 1, 1).to_datetime()
+            return (solar_spring - timedelta(days=1)).date()
+
+        return ZhDate(year, lunar_month, lunar_day).to_datetime().date()
+    except Exception as e:
+        logger.warning(f"Failed to convert lunar date {year}/{lunar_month}/{lunar_day}: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _holiday_table(year: int) -> dict:
+    """
+    Precompute (start_date, duration_days) for every known holiday in a year.
+
+    Built lazily once per year and cached, so the first holiday parse of a
+    year pays for all lunar conversions in one pass and every later lookup
+    is a dict hit.
+    """
+    table = {}
+    for name, (kind, month, day, duration) in FuzzyTimeParser._HOLIDAYS.items():
+        if kind is _KIND_SOLAR:
+            table[name] = (date(year, month, day), duration)
+        elif kind is _KIND_LUNAR:
+            solar_date = _lunar_to_solar_date(year, month, day)
+            if solar_date is not None:
+                table[name] = (solar_date, duration)
+        else:
+            # Qingming is usually on April 4th or 5th
+            table[name] = (date(year, 4, 4 if _is_leap_year(year) else 5), duration)
+    return table
+
+
+def _resolve_holiday(year: int, name: str) -> Optional[Tuple[date, int]]:
+    """Resolve a holiday name to (start_date, duration_days) for a year."""
+    return _holiday_table(year).get(name)
+
+
+def _build_char_dispatch(
+    strategies: tuple, first_chars: dict, search_strategies: tuple
+) -> dict:
+    """
+    Bucket strategies by the first character an input can start with.
+
+    Each bucket is a filtered view of the canonical strategy tuple, so
+    every strategy keeps its priority index. Strategies listed in
+    search_strategies scan with search() and can match mid-string, so
+    they are kept in every bucket regardless of first character.
+    """
+    chars = set()
+    for strategy_chars in first_chars.values():
+        chars.update(strategy_chars)
+    return {
+        ch: tuple(
+            strategy
+            for strategy in strategies
+            if strategy in search_strategies or ch in first_chars[strategy]
+        )
+        for ch in chars
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class _Ctx:
+    """Immutable snapshot of "now" threaded through the sub-parsers.
+
+    Keeping the snapshot out of instance state makes a parser object
+    reentrant, so a single cached instance can serve concurrent requests.
+    """
+
+    now: datetime
+    today: date
+    ordinal: int
+    weekday: int
+    year: int
+    month: int
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedTime:
+    """
+    Parsed time result.
+
+    A frozen slots dataclass rather than a model: results are produced in
+    bulk, never mutated, and carry no validation needs of their own, so
+    skipping the per-instance __dict__ keeps them small and fast to read.
+    Pydantic still validates and serializes them inside ParseTimeOutput.
+
+    Attributes:
+        value: Parsed datetime string(s). Single string for a point in
+            time, list of [start, end] for a range.
+        original_expression: Original input expression.
+        is_range: Whether the result is a time range.
+        is_date_only: Whether the result is date only (no time component).
+        confidence: Confidence score (0-1) of the parsing.
+    """
+
+    value: Union[str, List[str]]
+    original_expression: str
+    is_range: bool = False
+    is_date_only: bool = False
+    confidence: float = 1.0
 
 
 class ParseTimeOutput(BaseModel):
@@ -94,6 +288,10 @@ class FuzzyTimeParser:
         "天": 6,
     }
 
+    # Same mapping keyed by code point: hashing a small int is cheaper
+    # than hashing a one-character string in the weekday hot path.
+    _WEEKDAYS_ORD = {ord(k): v for k, v in WEEKDAYS.items()}
+
     # Solar (Gregorian) holidays - fixed dates (month, day, duration_days)
     SOLAR_HOLIDAYS = {
         "元旦": (1, 1, 1),
@@ -140,8 +338,144 @@ class FuzzyTimeParser:
         "小年": (12, 23, 1),
     }
 
-    # Qingming requires special handling (based on solar term, usually April 4-6)
-    QINGMING_HOLIDAYS = {"清明", "清明节"}
+    # Unified holiday table: name -> (kind, month, day, duration_days).
+    # "solar" entries use Gregorian month/day, "lunar" entries lunar
+    # month/day; "qingming" is resolved from the solar term (April 4-6),
+    # so its month/day here are placeholders.
+    _HOLIDAYS = {
+        **{name: (_KIND_SOLAR, m, d, dur) for name, (m, d, dur) in SOLAR_HOLIDAYS.items()},
+        **{name: (_KIND_LUNAR, m, d, dur) for name, (m, d, dur) in LUNAR_HOLIDAYS.items()},
+        "清明": (_KIND_QINGMING, 4, 0, 1),
+        "清明节": (_KIND_QINGMING, 4, 0, 1),
+    }
+
+    # Precompiled patterns (compiled once at class load instead of per call)
+
+    # Range separators normalized to "到" in one C-level pass
+    _RANGE_TRANS = str.maketrans({"至": "到", "-": "到", "~": "到"})
+
+    # First characters of all known holiday names; lets _parse_holiday skip
+    # the name scan for expressions that cannot contain a holiday.
+    _HOLIDAY_FIRST_CHARS = frozenset(h[0] for h in _HOLIDAYS)
+
+    # All holiday names fused into one alternation so recognition is a
+    # single C-level scan; longest names first so 国庆节 wins over 国庆.
+    _HOLIDAY_NAME_PAT = re.compile(
+        "|".join(sorted(_HOLIDAYS, key=len, reverse=True))
+    )
+
+    # Full-expression pattern for time-only expressions like "8点30分"
+    _TIME_ONLY_PAT = re.compile(
+        r"(凌晨|早上|上午|中午|下午|晚上|深夜)?(\d+|[一二三四五六七八九十]+)点"
+        r"(?:(\d+|[一二三四五六七八九十]+)分?)?"
+    )
+
+    # Combined date+time patterns share one time-suffix tail
+    _TIME_SUFFIX = (
+        r"\s*(凌晨|早上|上午|中午|下午|晚上|深夜)?"
+        r"(\d+|[一二三四五六七八九十]+)点"
+        r"(?:(\d+|[一二三四五六七八九十]+)分?)?$"
+    )
+    _FULL_DATE_TIME_PAT = re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})[日号]" + _TIME_SUFFIX)
+    _MONTH_DAY_TIME_PAT = re.compile(r"(\d{1,2})月(\d{1,2})[日号]" + _TIME_SUFFIX)
+    _DAY_TIME_PAT = re.compile(r"(\d{1,2})[日号]" + _TIME_SUFFIX)
+
+    # Relative day + time, e.g. "昨天下午3点"; longer keys first so the
+    # alternation prefers 大前天 over 前天.
+    _RELATIVE_DAY_TIME_PAT = re.compile(
+        r"(大前天|大后天|前天|后天|昨天|昨日|今天|今日|明天|明日|前日|后日)" + _TIME_SUFFIX
+    )
+
+    _RELATIVE_DAY_OFFSETS = {
+        "大前天": -3,
+        "大后天": 3,
+        "前天": -2,
+        "后天": 2,
+        "昨天": -1,
+        "昨日": -1,
+        "今天": 0,
+        "今日": 0,
+        "明天": 1,
+        "明日": 1,
+        "前日": -2,
+        "后日": 2,
+    }
+
+    _RECENT_PERIOD_PAT = re.compile(
+        r"(最近|过去|近)(\d+|半|[一二两三四五六七八九十]+)(天|日|周|个?星期|个?月)"
+    )
+
+    # One fused alternation for relative days: either an exact day word
+    # (longer words first so 大前天 beats 前天, anchored — bare words only)
+    # or a "N天/日前/后" phrase, which tolerates trailing text so inputs
+    # like 三天前的事 keep resolving. The named group that fired picks the
+    # branch, so one automaton pass replaces a word loop + pattern tests.
+    _RELATIVE_DAY_PAT = re.compile(
+        r"(?:(?P<word>大前天|大后天|前天|前日|后天|后日|昨天|昨日|今天|今日|明天|明日)$"
+        r"|(?P<num>\d+|[一二三四五六七八九十]+)[天日](?P<dir>[前后]))"
+    )
+
+    # One fused pattern for relative weeks: either a named prefix week
+    # ("上周...", prefix semantics like the old startswith scan) or a
+    # "N周前/后" / "N个星期前/后" phrase; both branches tolerate trailing
+    # text, so 上周的会议 and 两周前的报告 parse alike.
+    _WEEK_PAT = re.compile(
+        r"(?:(?P<pre>上上|上一|上|下下|下一|下|本|这)周"
+        r"|(?P<num>\d+|[一二两三四五六七八九十]+)(?:周|个?星期)(?P<dir>[前后]))"
+    )
+
+    _WEEK_PREFIX_OFFSETS = {
+        "本": 0,
+        "这": 0,
+        "上": -1,
+        "上一": -1,
+        "上上": -2,
+        "下": 1,
+        "下一": 1,
+        "下下": 2,
+    }
+
+    # Relative months, fused the same way as _WEEK_PAT: a named month word
+    # or a "N个月前/后" phrase, both with prefix semantics like the old
+    # startswith scan.
+    _RELATIVE_MONTH_PAT = re.compile(
+        r"(?:(?P<word>这个月|上个月|下个月|本月|上月|下月)"
+        r"|(?P<num>\d+|[一二三四五六七八九十]+)个?月(?P<dir>[前后]))"
+    )
+
+    _MONTH_WORD_OFFSETS = {
+        "本月": 0,
+        "这个月": 0,
+        "上个月": -1,
+        "上月": -1,
+        "下个月": 1,
+        "下月": 1,
+    }
+
+    _TIME_OF_DAY_PAT = re.compile(
+        r"(凌晨|早上|上午|中午|下午|晚上|深夜)?(\d+|[一二三四五六七八九十]+)点"
+        r"(?:(\d+|[一二三四五六七八九十]+)分?)?"
+    )
+
+    _WEEKDAY_PAT = re.compile(r"(上上?|下下?|这)?(?:周|星期)([一二三四五六日天])")
+
+    _SPECIFIC_DATE_PATTERNS = (
+        # Full date: 2024年1月1日
+        (
+            re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})[日号]?"),
+            lambda ctx, m: (int(m.group(1)), int(m.group(2)), int(m.group(3))),
+        ),
+        # Month and day: 1月1日
+        (
+            re.compile(r"(\d{1,2})月(\d{1,2})[日号]?"),
+            lambda ctx, m: (ctx.year, int(m.group(1)), int(m.group(2))),
+        ),
+        # Day only: 15号
+        (
+            re.compile(r"(\d{1,2})[日号]"),
+            lambda ctx, m: (ctx.year, ctx.month, int(m.group(1))),
+        ),
+    )
 
     def __init__(self, timezone: str = "Asia/Shanghai"):
         """
@@ -150,19 +484,41 @@ class FuzzyTimeParser:
         Args:
             timezone: Timezone string (e.g., "Asia/Shanghai", "UTC")
         """
-        self.tz = ZoneInfo(timezone)
+        self.tz = _zone(timezone)
         self._now = None
+        # Memoized results keyed by (expression, minute); repeated phrases
+        # within the same minute resolve to identical strings.
+        self._cache: dict = {}
+        # Warm the holiday tables for the surrounding years so lunar
+        # conversions never run inside a request; spring-festival queries
+        # in January routinely land in the adjacent year. The tables are
+        # module-level and cached, so only the first parser pays.
+        this_year = datetime.now(self.tz).year
+        for year in range(this_year - 2, this_year + 6):
+            _holiday_table(year)
 
     @property
     def now(self) -> datetime:
-        """Get current datetime (cached for consistent parsing within a single parse call)."""
-        if self._now is None:
-            self._now = datetime.now(self.tz)
-        return self._now
+        """Current datetime, or the pinned value inside a freeze_now() block."""
+        if self._now is not None:
+            return self._now
+        return datetime.now(self.tz)
 
-    def reset_now(self) -> None:
-        """Reset cached now time."""
-        self._now = None
+    @contextmanager
+    def freeze_now(self, now: datetime):
+        """
+        Pin "now" to a fixed datetime for the duration of the block.
+
+        The sanctioned way to parse against a fixed clock — used by tests
+        and by parse_batch for snapshot consistency. Nests safely: the
+        previous pin (if any) is restored on exit.
+        """
+        previous = self._now
+        self._now = now
+        try:
+            yield self
+        finally:
+            self._now = previous
 
     def parse(self, expression: str) -> ParsedTime:
         """
@@ -174,32 +530,80 @@ class FuzzyTimeParser:
         Returns:
             ParsedTime with parsed result
         """
-        self.reset_now()
+        return self._parse_cached(expression)
+
+    def parse_batch(self, expressions: List[str]) -> List[ParsedTime]:
+        """
+        Parse multiple fuzzy time expressions against a single time snapshot.
+
+        All expressions are resolved relative to the same "now", so a batch
+        spanning a midnight boundary stays internally consistent, and the
+        clock is read only once.
+
+        Args:
+            expressions: Fuzzy time expressions in Chinese
+
+        Returns:
+            List of ParsedTime results, one per expression
+        """
+        ctx = self._make_ctx()
+        return [self._parse_cached(expression, ctx) for expression in expressions]
+
+    # Cache at most this many results before starting over; parse results
+    # are treated as immutable by all callers.
+    _CACHE_MAX = 256
+
+    def _parse_cached(self, expression: str, ctx: Optional[_Ctx] = None) -> ParsedTime:
+        """Memoize _parse_impl per (expression, minute of "now")."""
+        if ctx is None:
+            ctx = self._make_ctx()
+        now = ctx.now
+        key = (expression, ctx.ordinal, now.hour, now.minute)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._parse_impl(expression, ctx)
+        if len(self._cache) >= self._CACHE_MAX:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
+
+    def _make_ctx(self) -> _Ctx:
+        """Build the per-parse time snapshot from the current clock."""
+        now = self.now
+        today = now.date()
+        return _Ctx(
+            now=now,
+            today=today,
+            ordinal=today.toordinal(),
+            weekday=today.weekday(),
+            year=today.year,
+            month=today.month,
+        )
+
+    def _parse_impl(self, expression: str, ctx: _Ctx) -> ParsedTime:
+        """Parse one expression against the given time snapshot."""
         expression = expression.strip()
 
-        # Try different parsing strategies
-        # Order matters: weekday must come before relative_week to handle "上周三" correctly
-        parsers = [
-            self._parse_range,
-            self._parse_holiday,
-            self._parse_date_time_combined,
-            self._parse_recent_period,
-            self._parse_relative_day,
-            self._parse_weekday,  # Before relative_week to handle "上周三" vs "上周"
-            self._parse_relative_week,
-            self._parse_relative_month,
-            self._parse_time_of_day,
-            self._parse_specific_date,
-        ]
-
-        for parser in parsers:
-            result = parser(expression)
+        if self._HAS_TEMPORAL.search(expression):
+            # Range separators can appear anywhere, so ranges are always
+            # tried first; everything else dispatches on the first character.
+            result = self._parse_range(expression, ctx)
             if result:
                 return result
 
+            strategies = (
+                self._FIRST_CHAR_DISPATCH.get(expression[:1]) or self._STRATEGIES
+            )
+            for strategy in strategies:
+                result = strategy(self, expression, ctx)
+                if result:
+                    return result
+
         # Fallback: return today's date with low confidence
         return ParsedTime(
-            value=self.now.strftime("%Y-%m-%d"),
+            value=_fmt_date(ctx.today),
             is_range=False,
             is_date_only=True,
             original_expression=expression,
@@ -208,33 +612,21 @@ class FuzzyTimeParser:
 
     def _cn_to_num(self, cn: str) -> int:
         """Convert Chinese number to int."""
+        # ASCII digits (any width) go straight to int(); the table is only
+        # consulted for Chinese numerals.
         if cn.isdigit():
             return int(cn)
 
-        # Handle compound numbers like "十五"
-        if cn in self.CN_NUMBERS:
-            return self.CN_NUMBERS[cn]
-
-        # Handle "十X" pattern
-        if cn.startswith("十") and len(cn) == 2:
-            return 10 + self.CN_NUMBERS.get(cn[1], 0)
+        return _CN_NUM_TABLE.get(cn, 1)
 
-        # Handle "X十" pattern
-        if len(cn) == 2 and cn.endswith("十"):
-            return self.CN_NUMBERS.get(cn[0], 0) * 10
-
-        # Handle "X十Y" pattern
-        if "十" in cn and len(cn) == 3:
-            parts = cn.split("十")
-            return self.CN_NUMBERS.get(parts[0], 0) * 10 + self.CN_NUMBERS.get(parts[1], 0)
-
-        return 1  # Default
-
-    def _format_datetime(self, dt: datetime, date_only: bool = False) -> str:
-        """Format datetime to standard string."""
+    def _format_datetime(self, dt: Union[datetime, date], date_only: bool = False) -> str:
+        """Format datetime (or date, when date_only) to standard string."""
         if date_only:
-            return dt.strftime("%Y-%m-%d")
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+            return _fmt_date(dt)
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+            f" {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
 
     def _build_datetime_result(
         self,
@@ -271,74 +663,64 @@ class FuzzyTimeParser:
 
     def _is_time_only_expr(self, expr: str) -> bool:
         """Check if expression is a time-only expression (no date component)."""
-        pattern = r"^(凌晨|早上|上午|中午|下午|晚上|深夜)?(\d+|[一二三四五六七八九十]+)点(?:(\d+|[一二三四五六七八九十]+)分?)?$"
-        return bool(re.match(pattern, expr))
+        return bool(self._TIME_ONLY_PAT.fullmatch(expr))
 
-    def _parse_range(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_range(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """Parse time range expressions like '昨天到今天'."""
-        range_patterns = [
-            (r"(.+?)到(.+)", True),
-            (r"(.+?)至(.+)", True),
-            (r"(.+?)-(.+)", True),
-            (r"(.+?)~(.+)", True),
-            (r"从(.+?)到(.+)", True),
-        ]
-
-        for pattern, _ in range_patterns:
-            match = re.match(pattern, expr)
-            if match:
-                start_expr = match.group(1).strip()
-                end_expr = match.group(2).strip()
+        if expr.startswith("从"):
+            expr = expr[1:]
 
-                start_result = self._parse_single(start_expr)
-                end_result = self._parse_single(end_expr)
+        # Normalize all separators to "到" then split once; the common
+        # (non-range) case exits on the length check without any regex work.
+        parts = expr.translate(self._RANGE_TRANS).split("到", 1)
+        if len(parts) != 2:
+            return None
 
-                if start_result and end_result:
-                    start_str = start_result[0]
-                    end_str = end_result[0]
+        start_expr = parts[0].strip()
+        end_expr = parts[1].strip()
+        if not start_expr or not end_expr:
+            return None
 
-                    # When end is a time-only expression (e.g., "8点"),
-                    # inherit the date from start (e.g., "1月5日 7点到8点")
-                    if (
-                        self._is_time_only_expr(end_expr)
-                        and len(start_str) >= 10
-                        and len(end_str) >= 10
-                    ):
-                        end_str = start_str[:10] + end_str[10:]
+        start_result = self._parse_single(start_expr, ctx)
+        end_result = self._parse_single(end_expr, ctx)
 
-                    return ParsedTime(
-                        value=[start_str, end_str],
-                        is_range=True,
-                        is_date_only=start_result[1] and end_result[1],
-                        original_expression=expr,
-                        confidence=min(start_result[2], end_result[2]),
-                    )
+        if start_result and end_result:
+            start_str = start_result[0]
+            end_str = end_result[0]
+
+            # When end is a time-only expression (e.g., "8点"),
+            # inherit the date from start (e.g., "1月5日 7点到8点")
+            if (
+                self._is_time_only_expr(end_expr)
+                and len(start_str) >= 10
+                and len(end_str) >= 10
+            ):
+                end_str = start_str[:10] + end_str[10:]
+
+            return ParsedTime(
+                value=[start_str, end_str],
+                is_range=True,
+                is_date_only=start_result[1] and end_result[1],
+                original_expression=expr,
+                confidence=min(start_result[2], end_result[2]),
+            )
 
         return None
 
-    def _parse_single(self, expr: str) -> Optional[Tuple[str, bool, float]]:
+    def _parse_single(self, expr: str, ctx: _Ctx) -> Optional[Tuple[str, bool, float]]:
         """Parse a single time expression. Returns (datetime_str, is_date_only, confidence)."""
-        parsers = [
-            self._parse_holiday,
-            self._parse_date_time_combined,
-            self._parse_recent_period,
-            self._parse_relative_day,
-            self._parse_relative_week,
-            self._parse_relative_month,
-            self._parse_time_of_day,
-            self._parse_specific_date,
-            self._parse_weekday,
-        ]
-
-        for parser in parsers:
-            result = parser(expr)
+        strategies = (
+            self._SINGLE_FIRST_CHAR_DISPATCH.get(expr[:1]) or self._SINGLE_STRATEGIES
+        )
+        for parser in strategies:
+            result = parser(self, expr, ctx)
             if result:
                 val = result.value if not isinstance(result.value, list) else result.value[0]
                 return (val, result.is_date_only, result.confidence)
 
         return None
 
-    def _parse_date_time_combined(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_date_time_combined(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """
         Parse combined date+time expressions like '1月5日 7点', '昨天下午3点'.
 
@@ -346,15 +728,9 @@ class FuzzyTimeParser:
         - Specific date + time: "2024年1月5日 下午3点30分", "1月5日 7点", "15号 9点"
         - Relative day + time: "昨天 7点", "明天下午3点", "后天上午9点"
         """
-        time_pat = (
-            r"\s*(凌晨|早上|上午|中午|下午|晚上|深夜)?"
-            r"(\d+|[一二三四五六七八九十]+)点"
-            r"(?:(\d+|[一二三四五六七八九十]+)分?)?$"
-        )
-
         # --- Specific date + time ---
         # Full date: 2024年1月5日 7点
-        match = re.match(r"(\d{4})年(\d{1,2})月(\d{1,2})[日号]" + time_pat, expr)
+        match = self._FULL_DATE_TIME_PAT.match(expr)
         if match:
             result = self._build_datetime_result(
                 int(match.group(1)),
@@ -369,10 +745,10 @@ class FuzzyTimeParser:
                 return result
 
         # Month+day: 1月5日 7点
-        match = re.match(r"(\d{1,2})月(\d{1,2})[日号]" + time_pat, expr)
+        match = self._MONTH_DAY_TIME_PAT.match(expr)
         if match:
             result = self._build_datetime_result(
-                self.now.year,
+                ctx.year,
                 int(match.group(1)),
                 int(match.group(2)),
                 match.group(3),
@@ -384,11 +760,11 @@ class FuzzyTimeParser:
                 return result
 
         # Day only: 15号 7点
-        match = re.match(r"(\d{1,2})[日号]" + time_pat, expr)
+        match = self._DAY_TIME_PAT.match(expr)
         if match:
             result = self._build_datetime_result(
-                self.now.year,
-                self.now.month,
+                ctx.year,
+                ctx.month,
                 int(match.group(1)),
                 match.group(2),
                 match.group(3),
@@ -399,79 +775,58 @@ class FuzzyTimeParser:
                 return result
 
         # --- Relative day + time ---
-        day_map = {
-            "大前天": -3,
-            "大后天": 3,
-            "前天": -2,
-            "后天": 2,
-            "昨天": -1,
-            "昨日": -1,
-            "今天": 0,
-            "今日": 0,
-            "明天": 1,
-            "明日": 1,
-            "前日": -2,
-            "后日": 2,
-        }
-
-        for key, offset in day_map.items():
-            match = re.match(re.escape(key) + time_pat, expr)
-            if match:
-                target_date = (self.now + timedelta(days=offset)).date()
-                result = self._build_datetime_result(
-                    target_date.year,
-                    target_date.month,
-                    target_date.day,
-                    match.group(1),
-                    match.group(2),
-                    match.group(3),
-                    expr,
-                    confidence=0.95,
-                )
-                if result:
-                    return result
+        match = self._RELATIVE_DAY_TIME_PAT.match(expr)
+        if match:
+            offset = self._RELATIVE_DAY_OFFSETS[match.group(1)]
+            target_date = date.fromordinal(ctx.ordinal + offset)
+            result = self._build_datetime_result(
+                target_date.year,
+                target_date.month,
+                target_date.day,
+                match.group(2),
+                match.group(3),
+                match.group(4),
+                expr,
+                confidence=0.95,
+            )
+            if result:
+                return result
 
         return None
 
-    def _parse_holiday(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_holiday(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """
         Parse holiday expressions like '国庆节期间'.
 
-        Handles three types of holidays:
-        1. Solar (Gregorian) holidays - fixed dates
-        2. Lunar (Chinese) holidays - converted from lunar calendar
-        3. Qingming - based on solar term (usually April 4-6)
+        Handles three types of holidays via the unified _HOLIDAYS table:
+        solar (fixed Gregorian dates), lunar (converted from the lunar
+        calendar) and Qingming (solar term, usually April 4-6).
         """
-        year = self.now.year
-
-        # 1. Check solar (Gregorian) holidays
-        for holiday, (month, day, duration) in self.SOLAR_HOLIDAYS.items():
-            if holiday in expr:
-                holiday_date = datetime(year, month, day, tzinfo=self.tz)
-                return self._create_holiday_result(holiday_date, duration, expr)
-
-        # 2. Check lunar (Chinese) holidays
-        for holiday, (lunar_month, lunar_day, duration) in self.LUNAR_HOLIDAYS.items():
-            if holiday in expr:
-                holiday_date = self._lunar_to_solar(year, lunar_month, lunar_day)
-                if holiday_date:
-                    return self._create_holiday_result(holiday_date, duration, expr)
-
-        # 3. Check Qingming - special handling based on solar term
-        if any(qm in expr for qm in self.QINGMING_HOLIDAYS):
-            # Qingming is usually on April 4th or 5th
-            qingming_day = 4 if self._is_leap_year(year) else 5
-            holiday_date = datetime(year, 4, qingming_day, tzinfo=self.tz)
-            duration = 3 if "期间" in expr else 1
-            return self._create_holiday_result(holiday_date, duration, expr)
+        # Fast path: no character of any holiday name appears in the input
+        if self._HOLIDAY_FIRST_CHARS.isdisjoint(expr):
+            return None
 
-        return None
+        match = self._HOLIDAY_NAME_PAT.search(expr)
+        if not match:
+            return None
+
+        holiday = match.group(0)
+        resolved = _resolve_holiday(ctx.year, holiday)
+        if resolved is None:
+            return None
+
+        start, duration = resolved
+        period = "期间" in expr
+        if self._HOLIDAYS[holiday][0] is _KIND_QINGMING:
+            duration = 3 if period else 1
+        return self._create_holiday_result(start, duration, expr, period)
 
     def _lunar_to_solar(self, year: int, lunar_month: int, lunar_day: int) -> Optional[datetime]:
         """
         Convert lunar (Chinese) date to solar (Gregorian) date.
 
-        Uses zhdate library for accurate conversion.
+        Delegates to the cached module-level converter and attaches this
+        parser's timezone.
 
         Args:
             year: Target year
@@ -481,42 +836,18 @@ class FuzzyTimeParser:
         Returns:
             datetime in Gregorian calendar, or None if conversion fails
         """
-        try:
-            from zhdate import ZhDate
-
-            # Handle special case: 除夕 (lunar 12/30 or 12/29)
-            if lunar_month == 12 and lunar_day >= 29:
-                try:
-                    spring_festival = ZhDate(year, 1, 1)
-                    solar_spring = spring_festival.to_datetime()
-                    chuxi_date = solar_spring - timedelta(days=1)
-                    return datetime(
-                        chuxi_date.year, chuxi_date.month, chuxi_date.day, tzinfo=self.tz
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to calculate Chuxi for year {year}: {e}")
-                    return None
-            else:
-                lunar = ZhDate(year, lunar_month, lunar_day)
-
-            # Convert to Gregorian
-            solar_date = lunar.to_datetime()
-            return datetime(solar_date.year, solar_date.month, solar_date.day, tzinfo=self.tz)
-
-        except ImportError:
-            logger.warning("zhdate library not installed, lunar date conversion unavailable")
-            return None
-        except Exception as e:
-            logger.warning(f"Failed to convert lunar date {year}/{lunar_month}/{lunar_day}: {e}")
+        solar = _lunar_to_solar_date(year, lunar_month, lunar_day)
+        if solar is None:
             return None
+        return datetime(solar.year, solar.month, solar.day, tzinfo=self.tz)
 
     def _create_holiday_result(
-        self, holiday_date: datetime, duration: int, expr: str
+        self, holiday_date: date, duration: int, expr: str, period: bool = False
     ) -> ParsedTime:
         """Create ParsedTime result for a holiday."""
-        if duration > 1 or "期间" in expr:
+        if duration > 1 or period:
             start = holiday_date
-            end = holiday_date + timedelta(days=duration - 1)
+            end = date.fromordinal(holiday_date.toordinal() + duration - 1)
             return ParsedTime(
                 value=[
                     self._format_datetime(start, True),
@@ -538,42 +869,37 @@ class FuzzyTimeParser:
 
     def _is_leap_year(self, year: int) -> bool:
         """Check if a year is a leap year."""
-        return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+        return _is_leap_year(year)
 
-    def _parse_recent_period(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_recent_period(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """Parse recent/past period expressions like '最近一周', '过去三天', '近两个月'."""
-        pattern = r"(最近|过去|近)(\d+|半|[一二两三四五六七八九十]+)(天|日|周|个?星期|个?月)"
-        match = re.match(pattern, expr)
+        match = self._RECENT_PERIOD_PAT.match(expr)
         if not match:
             return None
 
         num_str = match.group(2)
         unit = match.group(3)
-        today = self.now.date()
+        today = ctx.today
 
         if num_str == "半":
             if unit in ("个月", "月"):
-                delta = timedelta(days=15)
+                days = 15
             else:
                 return None
         else:
             num = self._cn_to_num(num_str)
             if unit in ("天", "日"):
-                delta = timedelta(days=num)
+                days = num
             elif unit in ("周", "星期", "个星期"):
-                delta = timedelta(weeks=num)
+                days = num * 7
             elif unit in ("月", "个月"):
                 # Go back N months: compute the 1st of that target month
-                year = self.now.year
-                month = self.now.month - num
-                while month < 1:
-                    month += 12
-                    year -= 1
-                start_date = datetime(year, month, 1, tzinfo=self.tz).date()
+                year, month = _month_shift(ctx.year, ctx.month, -num)
+                start_date = date(year, month, 1)
                 return ParsedTime(
                     value=[
-                        start_date.strftime("%Y-%m-%d"),
-                        today.strftime("%Y-%m-%d"),
+                        _fmt_date(start_date),
+                        _fmt_date(today),
                     ],
                     is_range=True,
                     is_date_only=True,
@@ -583,11 +909,11 @@ class FuzzyTimeParser:
             else:
                 return None
 
-        start_date = today - delta
+        start_date = date.fromordinal(ctx.ordinal - days)
         return ParsedTime(
             value=[
-                start_date.strftime("%Y-%m-%d"),
-                today.strftime("%Y-%m-%d"),
+                _fmt_date(start_date),
+                _fmt_date(today),
             ],
             is_range=True,
             is_date_only=True,
@@ -595,199 +921,94 @@ class FuzzyTimeParser:
             confidence=0.9,
         )
 
-    def _parse_relative_day(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_relative_day(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """Parse relative day expressions like '昨天', '三天前'."""
-        # Direct day references
-        day_map = {
-            "今天": 0,
-            "今日": 0,
-            "昨天": -1,
-            "昨日": -1,
-            "前天": -2,
-            "前日": -2,
-            "大前天": -3,
-            "明天": 1,
-            "明日": 1,
-            "后天": 2,
-            "后日": 2,
-            "大后天": 3,
-        }
-
-        for key, offset in day_map.items():
-            if expr == key:
-                target = self.now + timedelta(days=offset)
-                return ParsedTime(
-                    value=self._format_datetime(target, True),
-                    is_range=False,
-                    is_date_only=True,
-                    original_expression=expr,
-                    confidence=1.0,
-                )
-
-        # Pattern: X天前/后
-        patterns = [
-            (r"(\d+|[一二三四五六七八九十]+)天前", -1),
-            (r"(\d+|[一二三四五六七八九十]+)天后", 1),
-            (r"(\d+|[一二三四五六七八九十]+)日前", -1),
-            (r"(\d+|[一二三四五六七八九十]+)日后", 1),
-        ]
+        match = self._RELATIVE_DAY_PAT.match(expr)
+        if not match:
+            return None
 
-        for pattern, direction in patterns:
-            match = re.match(pattern, expr)
-            if match:
-                num = self._cn_to_num(match.group(1))
-                target = self.now + timedelta(days=num * direction)
-                return ParsedTime(
-                    value=self._format_datetime(target, True),
-                    is_range=False,
-                    is_date_only=True,
-                    original_expression=expr,
-                    confidence=0.95,
-                )
+        word = match.group("word")
+        if word:
+            offset = self._RELATIVE_DAY_OFFSETS[word]
+            confidence = 1.0
+        else:
+            num = self._cn_to_num(match.group("num"))
+            offset = num if match.group("dir") == "后" else -num
+            confidence = 0.95
 
-        return None
+        target = date.fromordinal(ctx.ordinal + offset)
+        return ParsedTime(
+            value=self._format_datetime(target, True),
+            is_range=False,
+            is_date_only=True,
+            original_expression=expr,
+            confidence=confidence,
+        )
 
-    def _parse_relative_week(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_relative_week(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """Parse relative week expressions like '上周', '三周前'."""
-        # Week references
-        week_map = {
-            "本周": 0,
-            "这周": 0,
-            "上周": -1,
-            "上一周": -1,
-            "上上周": -2,
-            "下周": 1,
-            "下一周": 1,
-            "下下周": 2,
-        }
-
-        for key, offset in week_map.items():
-            if expr == key or expr.startswith(key):
-                # Get start of the target week (Monday)
-                today = self.now.date()
-                start_of_week = today - timedelta(days=today.weekday()) + timedelta(weeks=offset)
-                end_of_week = start_of_week + timedelta(days=6)
-
-                return ParsedTime(
-                    value=[
-                        start_of_week.strftime("%Y-%m-%d"),
-                        end_of_week.strftime("%Y-%m-%d"),
-                    ],
-                    is_range=True,
-                    is_date_only=True,
-                    original_expression=expr,
-                    confidence=0.95,
-                )
-
-        # Pattern: X周前/后 (两 is also included for "两周前")
-        patterns = [
-            (r"(\d+|[一二两三四五六七八九十]+)周前", -1),
-            (r"(\d+|[一二两三四五六七八九十]+)周后", 1),
-            (r"(\d+|[一二两三四五六七八九十]+)个?星期前", -1),
-            (r"(\d+|[一二两三四五六七八九十]+)个?星期后", 1),
-        ]
+        match = self._WEEK_PAT.match(expr)
+        if not match:
+            return None
 
-        for pattern, direction in patterns:
-            match = re.match(pattern, expr)
-            if match:
-                num = self._cn_to_num(match.group(1))
-                today = self.now.date()
-                start_of_week = (
-                    today - timedelta(days=today.weekday()) + timedelta(weeks=num * direction)
-                )
-                end_of_week = start_of_week + timedelta(days=6)
+        prefix = match.group("pre")
+        if prefix:
+            offset = self._WEEK_PREFIX_OFFSETS[prefix]
+            confidence = 0.95
+        else:
+            # "N周前/后" (两 is also included for "两周前")
+            num = self._cn_to_num(match.group("num"))
+            offset = num if match.group("dir") == "后" else -num
+            confidence = 0.9
 
-                return ParsedTime(
-                    value=[
-                        start_of_week.strftime("%Y-%m-%d"),
-                        end_of_week.strftime("%Y-%m-%d"),
-                    ],
-                    is_range=True,
-                    is_date_only=True,
-                    original_expression=expr,
-                    confidence=0.9,
-                )
+        start_ord, end_ord = _week_range_ords(ctx.ordinal, ctx.weekday, offset)
+        start_of_week = date.fromordinal(start_ord)
+        end_of_week = date.fromordinal(end_ord)
 
-        return None
+        return ParsedTime(
+            value=[
+                _fmt_date(start_of_week),
+                _fmt_date(end_of_week),
+            ],
+            is_range=True,
+            is_date_only=True,
+            original_expression=expr,
+            confidence=confidence,
+        )
 
-    def _parse_relative_month(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_relative_month(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """Parse relative month expressions like '上个月', '三个月前'."""
-        month_map = {
-            "本月": 0,
-            "这个月": 0,
-            "上个月": -1,
-            "上月": -1,
-            "下个月": 1,
-            "下月": 1,
-        }
-
-        for key, offset in month_map.items():
-            if expr == key or expr.startswith(key):
-                year = self.now.year
-                month = self.now.month + offset
-
-                while month < 1:
-                    month += 12
-                    year -= 1
-                while month > 12:
-                    month -= 12
-                    year += 1
-
-                _, last_day = monthrange(year, month)
-
-                return ParsedTime(
-                    value=[
-                        f"{year}-{month:02d}-01",
-                        f"{year}-{month:02d}-{last_day:02d}",
-                    ],
-                    is_range=True,
-                    is_date_only=True,
-                    original_expression=expr,
-                    confidence=0.95,
-                )
-
-        # Pattern: X个月前/后
-        patterns = [
-            (r"(\d+|[一二三四五六七八九十]+)个?月前", -1),
-            (r"(\d+|[一二三四五六七八九十]+)个?月后", 1),
-        ]
-
-        for pattern, direction in patterns:
-            match = re.match(pattern, expr)
-            if match:
-                num = self._cn_to_num(match.group(1))
-                offset = num * direction
-
-                year = self.now.year
-                month = self.now.month + offset
-
-                while month < 1:
-                    month += 12
-                    year -= 1
-                while month > 12:
-                    month -= 12
-                    year += 1
+        match = self._RELATIVE_MONTH_PAT.match(expr)
+        if not match:
+            return None
 
-                _, last_day = monthrange(year, month)
+        word = match.group("word")
+        if word:
+            offset = self._MONTH_WORD_OFFSETS[word]
+            confidence = 0.95
+        else:
+            num = self._cn_to_num(match.group("num"))
+            offset = num if match.group("dir") == "后" else -num
+            confidence = 0.85
 
-                return ParsedTime(
-                    value=[
-                        f"{year}-{month:02d}-01",
-                        f"{year}-{month:02d}-{last_day:02d}",
-                    ],
-                    is_range=True,
-                    is_date_only=True,
-                    original_expression=expr,
-                    confidence=0.85,
-                )
+        year, month = _month_shift(ctx.year, ctx.month, offset)
+        last_day = _last_day_of_month(year, month)
 
-        return None
+        return ParsedTime(
+            value=[
+                f"{year}-{month:02d}-01",
+                f"{year}-{month:02d}-{last_day:02d}",
+            ],
+            is_range=True,
+            is_date_only=True,
+            original_expression=expr,
+            confidence=confidence,
+        )
 
-    def _parse_time_of_day(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_time_of_day(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """Parse time of day expressions like '上午9点'."""
         # Single time point
-        pattern = r"(凌晨|早上|上午|中午|下午|晚上|深夜)?(\d+|[一二三四五六七八九十]+)点(?:(\d+|[一二三四五六七八九十]+)分?)?"
-        match = re.search(pattern, expr)
+        match = self._TIME_OF_DAY_PAT.search(expr)
 
         if match:
             period = match.group(1)
@@ -801,7 +1022,7 @@ class FuzzyTimeParser:
                 elif period == "凌晨" and hour == 12:
                     hour = 0
 
-            today = self.now.date()
+            today = ctx.today
             target = datetime(today.year, today.month, today.day, hour, minute, tzinfo=self.tz)
 
             return ParsedTime(
@@ -814,29 +1035,14 @@ class FuzzyTimeParser:
 
         return None
 
-    def _parse_specific_date(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_specific_date(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """Parse specific date expressions like '2024年1月1日'."""
-        patterns = [
-            # Full date: 2024年1月1日
-            (
-                r"(\d{4})年(\d{1,2})月(\d{1,2})[日号]?",
-                lambda m: (int(m.group(1)), int(m.group(2)), int(m.group(3))),
-            ),
-            # Month and day: 1月1日
-            (
-                r"(\d{1,2})月(\d{1,2})[日号]?",
-                lambda m: (self.now.year, int(m.group(1)), int(m.group(2))),
-            ),
-            # Day only: 15号
-            (r"(\d{1,2})[日号]", lambda m: (self.now.year, self.now.month, int(m.group(1)))),
-        ]
-
-        for pattern, extractor in patterns:
-            match = re.match(pattern, expr)
+        for pattern, extractor in self._SPECIFIC_DATE_PATTERNS:
+            match = pattern.match(expr)
             if match:
                 try:
-                    year, month, day = extractor(match)
-                    target = datetime(year, month, day, tzinfo=self.tz)
+                    year, month, day = extractor(ctx, match)
+                    target = date(year, month, day)
                     return ParsedTime(
                         value=self._format_datetime(target, True),
                         is_range=False,
@@ -849,37 +1055,23 @@ class FuzzyTimeParser:
 
         return None
 
-    def _parse_weekday(self, expr: str) -> Optional[ParsedTime]:
+    def _parse_weekday(self, expr: str, ctx: _Ctx) -> Optional[ParsedTime]:
         """Parse weekday expressions like '周一', '上周三'."""
         # Pattern: (上|下|这)?周/星期X
-        pattern = r"(上上?|下下?|这)?(?:周|星期)([一二三四五六日天])"
-        match = re.match(pattern, expr)
+        match = self._WEEKDAY_PAT.match(expr)
 
         if match:
-            prefix = match.group(1) or "这"
-            weekday_cn = match.group(2)
-            weekday = self.WEEKDAYS.get(weekday_cn, 0)
-
-            today = self.now.date()
-            current_weekday = today.weekday()
-
-            # Calculate week offset
-            week_offset = 0
-            if prefix == "上":
-                week_offset = -1
-            elif prefix == "上上":
-                week_offset = -2
-            elif prefix == "下":
-                week_offset = 1
-            elif prefix == "下下":
-                week_offset = 2
-
-            # Calculate target date
-            days_diff = weekday - current_weekday + (week_offset * 7)
-            target = today + timedelta(days=days_diff)
+            weekday = self._WEEKDAYS_ORD.get(ord(match.group(2)), 0)
+            # Every prefix _WEEKDAY_PAT accepts is already in the relative-week
+            # offsets table, so one lookup replaces the old if/elif ladder.
+            week_offset = self._WEEK_PREFIX_OFFSETS[match.group(1) or "这"]
+
+            target = date.fromordinal(
+                ctx.ordinal + _weekday_offset(week_offset, weekday, ctx.weekday)
+            )
 
             return ParsedTime(
-                value=target.strftime("%Y-%m-%d"),
+                value=_fmt_date(target),
                 is_range=False,
                 is_date_only=True,
                 original_expression=expr,
@@ -887,3 +1079,73 @@ class FuzzyTimeParser:
             )
 
         return None
+
+    # --- Parse strategy dispatch (built once at class load) ---
+    # Order matters: weekday must come before relative_week to handle
+    # "上周三" correctly; holidays outrank everything so "五一" is not read
+    # as the numeral five.
+    _STRATEGIES = (
+        _parse_holiday,
+        _parse_date_time_combined,
+        _parse_recent_period,
+        _parse_relative_day,
+        _parse_weekday,  # Before relative_week to handle "上周三" vs "上周"
+        _parse_relative_week,
+        _parse_relative_month,
+        _parse_time_of_day,
+        _parse_specific_date,
+    )
+
+    # First characters that each strategy's patterns can possibly start
+    # with; used to skip strategies that cannot match a given input.
+    _STRATEGY_FIRST_CHARS = {
+        _parse_holiday: _HOLIDAY_FIRST_CHARS,
+        _parse_date_time_combined: "0123456789今昨明前后大",
+        _parse_recent_period: "最过近",
+        _parse_relative_day: "0123456789一二三四五六七八九十今昨明前后大",
+        _parse_weekday: "上下这周星",
+        _parse_relative_week: "0123456789一二两三四五六七八九十本这上下",
+        _parse_relative_month: "0123456789一二三四五六七八九十本这上下",
+        _parse_time_of_day: "0123456789一二三四五六七八九十凌早上中下晚深",
+        _parse_specific_date: "0123456789",
+    }
+
+    # Strategy order for the halves of a range expression; rebuilt lists of
+    # bound methods per call were pure allocation overhead.
+    _SINGLE_STRATEGIES = (
+        _parse_holiday,
+        _parse_date_time_combined,
+        _parse_recent_period,
+        _parse_relative_day,
+        _parse_relative_week,
+        _parse_relative_month,
+        _parse_time_of_day,
+        _parse_specific_date,
+        _parse_weekday,
+    )
+
+    # Strategies that scan with search() can match mid-string ("今年春节",
+    # "8点半开会"), so they stay in every bucket — at their canonical
+    # index, preserving both the "holidays outrank everything" order and
+    # time-of-day's slot ahead of the later strategies.
+    _SEARCH_STRATEGIES = (_parse_holiday, _parse_time_of_day)
+
+    _FIRST_CHAR_DISPATCH = _build_char_dispatch(
+        _STRATEGIES, _STRATEGY_FIRST_CHARS, _SEARCH_STRATEGIES
+    )
+
+    # The same buckets in _SINGLE_STRATEGIES order, so the halves of a
+    # range expression also skip strategies that cannot match.
+    _SINGLE_FIRST_CHAR_DISPATCH = _build_char_dispatch(
+        _SINGLE_STRATEGIES, _STRATEGY_FIRST_CHARS, _SEARCH_STRATEGIES
+    )
+
+    # Quick pre-filter: every parseable phrase contains at least one of
+    # these characters (a strategy anchor character, a digit or numeral,
+    # or an interior marker like 点 or 到). Inputs with none of them
+    # cannot match anything, so parsing falls straight to the fallback.
+    _TEMPORAL_CHARS = set("从到至~-点分时期年月日号周星天半两")
+    for _chars in _STRATEGY_FIRST_CHARS.values():
+        _TEMPORAL_CHARS.update(_chars)
+    _HAS_TEMPORAL = re.compile("[" + re.escape("".join(sorted(_TEMPORAL_CHARS))) + "]")
+    del _chars
@@ -5,16 +5,45 @@ MCP Server - FastMCP server definition for Chinese time parsing.
 This module defines the MCP server and its tools using FastMCP 2.x.
 """
 
+import functools
+import json
+
 from fastmcp import FastMCP
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
 
 from .parser import FuzzyTimeParser, ParseTimeOutput
 
+try:
+    import orjson
+except ImportError:  # serialization degrades gracefully to stdlib json
+    orjson = None
+
 mcp = FastMCP(
     name="mcp-chinese-time",
     instructions="中文模糊时间表达式解析 MCP 服务器 (Chinese Fuzzy Time Expression Parser)",
 )
 
 
+def _dump_json(data) -> str:
+    """Serialize a response payload to JSON text; orjson (C-level) when available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_parser(timezone: str) -> FuzzyTimeParser:
+    """
+    Get (or build) the shared parser for a timezone.
+
+    Sharing is safe across requests: parse() re-reads the clock on every
+    call and threads the snapshot through the sub-parsers, so a warm
+    instance never leaks a stale "now" into a later request.
+    """
+    return FuzzyTimeParser(timezone=timezone)
+
+
 async def _parse_time_handler(expression: str, timezone: str = "Asia/Shanghai") -> dict:
     """
     Core handler for parsing fuzzy time expressions.
@@ -22,18 +51,39 @@ async def _parse_time_handler(expression: str, timezone: str = "Asia/Shanghai")
     This is separated from the MCP tool decorator to allow direct testing.
     """
     try:
-        parser = FuzzyTimeParser(timezone=timezone)
+        parser = _get_parser(timezone)
         result = parser.parse(expression)
 
-        output = ParseTimeOutput(success=True, parsed=result)
+        output = ParseTimeOutput.model_construct(success=True, parsed=result, error=None)
         return output.model_dump()
     except Exception as e:
-        output = ParseTimeOutput(success=False, error=str(e))
+        output = ParseTimeOutput.model_construct(success=False, parsed=None, error=str(e))
         return output.model_dump()
 
 
+async def _parse_time_batch_handler(
+    expressions: list[str], timezone: str = "Asia/Shanghai"
+) -> list[dict]:
+    """
+    Core handler for parsing several fuzzy time expressions in one call.
+
+    All expressions share one parser and one clock snapshot, so the batch
+    stays internally consistent and setup costs are paid once.
+    """
+    try:
+        parser = _get_parser(timezone)
+        results = parser.parse_batch(expressions)
+        return [
+            ParseTimeOutput.model_construct(success=True, parsed=result, error=None).model_dump()
+            for result in results
+        ]
+    except Exception as e:
+        error = ParseTimeOutput.model_construct(success=False, parsed=None, error=str(e))
+        return [error.model_dump() for _ in expressions]
+
+
 @mcp.tool
-async def parse_time(expression: str, timezone: str = "Asia/Shanghai") -> dict:
+async def parse_time(expression: str, timezone: str = "Asia/Shanghai") -> ToolResult:
     """
     解析模糊时间表达式为标准日期时间格式。
 
@@ -70,4 +120,38 @@ async def parse_time(expression: str, timezone: str = "Asia/Shanghai") -> dict:
         >>> await parse_time("国庆节期间")
         {"success": true, "parsed": {"value": ["2024-10-01", "2024-10-07"], ...}}
     """
-    return await _parse_time_handler(expression, timezone)
+    result = await _parse_time_handler(expression, timezone)
+    return ToolResult(
+        content=[TextContent(type="text", text=_dump_json(result))],
+        structured_content=result,
+    )
+
+
+@mcp.tool
+async def parse_time_batch(expressions: list[str], timezone: str = "Asia/Shanghai") -> ToolResult:
+    """
+    批量解析模糊时间表达式为标准日期时间格式。
+
+    Parse multiple fuzzy Chinese time expressions in one call. Every
+    expression is resolved against the same clock snapshot, so a batch
+    spanning a midnight boundary stays internally consistent.
+
+    Args:
+        expressions: Fuzzy time expressions in Chinese
+                    (e.g., ["昨天", "三周前", "国庆节期间"])
+        timezone: Timezone for parsing (default: Asia/Shanghai)
+
+    Returns:
+        List of dictionaries, one per expression, each with the same
+        shape as parse_time's result (success / parsed / error).
+
+    Examples:
+        >>> await parse_time_batch(["昨天", "明天"])
+        [{"success": true, "parsed": {"value": "2024-01-14", ...}},
+         {"success": true, "parsed": {"value": "2024-01-16", ...}}]
+    """
+    results = await _parse_time_batch_handler(expressions, timezone)
+    return ToolResult(
+        content=[TextContent(type="text", text=_dump_json(results))],
+        structured_content={"result": results},
+    )
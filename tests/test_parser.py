@@ -14,28 +14,20 @@ from mcp_chinese_time.parser import FuzzyTimeParser
 class TestFuzzyTimeParser:
     """Test cases for FuzzyTimeParser."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance with fixed time."""
-        parser = FuzzyTimeParser(timezone="Asia/Shanghai")
-        return parser
-
     @pytest.fixture
     def fixed_now(self):
         """Fixed datetime for consistent testing."""
         return datetime(2024, 1, 15, 10, 30, 0, tzinfo=ZoneInfo("Asia/Shanghai"))
 
-    def set_fixed_time(self, parser, fixed_now):
-        """Helper to set fixed time on parser."""
-        # Override the now property by setting _now directly and preventing reset
-        original_reset = parser.reset_now
-        parser._now = fixed_now
-        parser.reset_now = lambda: None  # Prevent reset
-        return original_reset
+    @pytest.fixture
+    def parser(self, fixed_now):
+        """Create a parser instance pinned to the fixed time."""
+        parser = FuzzyTimeParser(timezone="Asia/Shanghai")
+        with parser.freeze_now(fixed_now):
+            yield parser
 
     def test_parse_today(self, parser, fixed_now):
         """Test parsing '今天'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("今天")
         assert result.value == "2024-01-15"
         assert result.is_date_only is True
@@ -43,33 +35,28 @@ class TestFuzzyTimeParser:
 
     def test_parse_yesterday(self, parser, fixed_now):
         """Test parsing '昨天'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("昨天")
         assert result.value == "2024-01-14"
         assert result.is_date_only is True
 
     def test_parse_tomorrow(self, parser, fixed_now):
         """Test parsing '明天'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("明天")
         assert result.value == "2024-01-16"
         assert result.is_date_only is True
 
     def test_parse_day_before_yesterday(self, parser, fixed_now):
         """Test parsing '前天'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("前天")
         assert result.value == "2024-01-13"
 
     def test_parse_day_after_tomorrow(self, parser, fixed_now):
         """Test parsing '后天'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("后天")
         assert result.value == "2024-01-17"
 
     def test_parse_n_days_ago(self, parser, fixed_now):
         """Test parsing 'N天前'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("三天前")
         assert result.value == "2024-01-12"
 
@@ -78,58 +65,62 @@ class TestFuzzyTimeParser:
 
     def test_parse_n_days_later(self, parser, fixed_now):
         """Test parsing 'N天后'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("三天后")
         assert result.value == "2024-01-18"
 
         result = parser.parse("7天后")
         assert result.value == "2024-01-22"
 
+    def test_parse_n_days_ago_with_suffix(self, parser):
+        """Test '三天前的事' still resolves the relative day."""
+        result = parser.parse("三天前的事")
+        assert result.value == "2024-01-12"
+        assert result.confidence == 0.95
+
+    def test_parse_n_weeks_ago_with_suffix(self, parser):
+        """Test '两周前的报告' still resolves the relative week range."""
+        result = parser.parse("两周前的报告")
+        assert result.is_range is True
+        assert result.value == ["2024-01-01", "2024-01-07"]
+
     def test_parse_this_week(self, parser, fixed_now):
         """Test parsing '本周' (week containing Jan 15, 2024 - Monday is Jan 15)."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("本周")
         assert result.is_range is True
         assert result.value == ["2024-01-15", "2024-01-21"]
 
     def test_parse_last_week(self, parser, fixed_now):
         """Test parsing '上周'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("上周")
         assert result.is_range is True
         assert result.value == ["2024-01-08", "2024-01-14"]
 
     def test_parse_next_week(self, parser, fixed_now):
         """Test parsing '下周'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("下周")
         assert result.is_range is True
         assert result.value == ["2024-01-22", "2024-01-28"]
 
     def test_parse_n_weeks_ago(self, parser, fixed_now):
         """Test parsing 'N周前'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("两周前")
         assert result.is_range is True
         assert result.value == ["2024-01-01", "2024-01-07"]
 
     def test_parse_this_month(self, parser, fixed_now):
         """Test parsing '本月'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("本月")
         assert result.is_range is True
         assert result.value == ["2024-01-01", "2024-01-31"]
 
     def test_parse_last_month(self, parser, fixed_now):
         """Test parsing '上个月'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("上个月")
         assert result.is_range is True
         assert result.value == ["2023-12-01", "2023-12-31"]
 
     def test_parse_next_month(self, parser, fixed_now):
         """Test parsing '下个月'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("下个月")
         assert result.is_range is True
         assert result.value == ["2024-02-01", "2024-02-29"]  # 2024 is a leap year
@@ -143,114 +134,109 @@ class TestFuzzyTimeParser:
 
     def test_parse_specific_date_month_day(self, parser, fixed_now):
         """Test parsing '1月20日'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("1月20日")
         assert result.value == "2024-01-20"
 
     def test_parse_specific_date_day_only(self, parser, fixed_now):
         """Test parsing '20号'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("20号")
         assert result.value == "2024-01-20"
 
     def test_parse_time_of_day_morning(self, parser, fixed_now):
         """Test parsing '上午9点'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("上午9点")
         assert result.value == "2024-01-15 09:00:00"
         assert result.is_date_only is False
 
     def test_parse_time_of_day_afternoon(self, parser, fixed_now):
         """Test parsing '下午3点30分'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("下午3点30分")
         assert result.value == "2024-01-15 15:30:00"
         assert result.is_date_only is False
 
     def test_parse_time_of_day_evening(self, parser, fixed_now):
         """Test parsing '晚上8点'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("晚上8点")
         assert result.value == "2024-01-15 20:00:00"
 
     def test_parse_weekday_this_week(self, parser, fixed_now):
         """Test parsing '周三' (this week)."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("周三")
         # Jan 15 is Monday, so Wednesday is Jan 17
         assert result.value == "2024-01-17"
 
     def test_parse_weekday_last_week(self, parser, fixed_now):
         """Test parsing '上周三'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("上周三")
         assert result.value == "2024-01-10"
 
     def test_parse_weekday_next_week(self, parser, fixed_now):
         """Test parsing '下周五'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("下周五")
         assert result.value == "2024-01-26"
 
     def test_parse_range_yesterday_to_today(self, parser, fixed_now):
         """Test parsing '昨天到今天'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("昨天到今天")
         assert result.is_range is True
         assert result.value == ["2024-01-14", "2024-01-15"]
 
     def test_parse_range_with_至(self, parser, fixed_now):
         """Test parsing '昨天至今天'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("昨天至今天")
         assert result.is_range is True
         assert result.value == ["2024-01-14", "2024-01-15"]
 
     def test_parse_range_weekday(self, parser, fixed_now):
         """Test parsing '上周一到周五'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("上周一到周五")
         assert result.is_range is True
         assert result.value == ["2024-01-08", "2024-01-19"]
 
     def test_parse_solar_holiday_national_day(self, parser, fixed_now):
         """Test parsing '国庆节'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("国庆节")
         assert result.is_range is True
         assert result.value == ["2024-10-01", "2024-10-07"]
 
     def test_parse_solar_holiday_labor_day(self, parser, fixed_now):
         """Test parsing '劳动节'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("劳动节")
         assert result.is_range is True
         assert result.value == ["2024-05-01", "2024-05-05"]
 
     def test_parse_solar_holiday_new_year(self, parser, fixed_now):
         """Test parsing '元旦'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("元旦")
         assert result.value == "2024-01-01"
         assert result.is_range is False
 
     def test_parse_holiday_with_period(self, parser, fixed_now):
         """Test parsing '国庆节期间'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("国庆节期间")
         assert result.is_range is True
         assert result.value == ["2024-10-01", "2024-10-07"]
 
     def test_parse_qingming(self, parser, fixed_now):
         """Test parsing '清明节'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("清明节")
         # 2024 is a leap year, so Qingming is April 4
         assert result.value == "2024-04-04"
 
+    def test_parse_range_weekday_with_time(self, parser):
+        """Test a range half starting with 周 keeps time-of-day priority."""
+        result = parser.parse("昨天到周三3点")
+        assert result.value == ["2024-01-14", "2024-01-15 03:00:00"]
+        assert result.is_range is True
+
+    def test_parse_holiday_mid_string(self, parser):
+        """Test a holiday name is still found behind a leading qualifier."""
+        result = parser.parse("今年国庆节")
+        assert result.value == ["2024-10-01", "2024-10-07"]
+        assert result.confidence == 0.95
+
     def test_parse_unknown_expression(self, parser, fixed_now):
         """Test parsing unknown expression returns fallback."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("随便什么")
         assert result.value == "2024-01-15"  # Falls back to today
         assert result.confidence == 0.3
@@ -283,21 +269,18 @@ class TestFuzzyTimeParser:
 class TestRecentPeriod:
     """Test cases for recent/past period expressions like '最近一周', '过去三天'."""
 
-    @pytest.fixture
-    def parser(self):
-        return FuzzyTimeParser(timezone="Asia/Shanghai")
-
     @pytest.fixture
     def fixed_now(self):
         return datetime(2024, 1, 15, 10, 30, 0, tzinfo=ZoneInfo("Asia/Shanghai"))
 
-    def set_fixed_time(self, parser, fixed_now):
-        parser._now = fixed_now
-        parser.reset_now = lambda: None
+    @pytest.fixture
+    def parser(self, fixed_now):
+        parser = FuzzyTimeParser(timezone="Asia/Shanghai")
+        with parser.freeze_now(fixed_now):
+            yield parser
 
     def test_recent_one_week(self, parser, fixed_now):
         """Test '最近一周' → [7 days ago, today]."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("最近一周")
         assert result.is_range is True
         assert result.confidence == 0.9
@@ -305,42 +288,36 @@ class TestRecentPeriod:
 
     def test_past_one_week(self, parser, fixed_now):
         """Test '过去一周' → same as 最近一周."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("过去一周")
         assert result.is_range is True
         assert result.value == ["2024-01-08", "2024-01-15"]
 
     def test_jin_one_week(self, parser, fixed_now):
         """Test '近一周' → same as 最近一周."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("近一周")
         assert result.is_range is True
         assert result.value == ["2024-01-08", "2024-01-15"]
 
     def test_recent_three_days(self, parser, fixed_now):
         """Test '最近三天' → [3 days ago, today]."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("最近三天")
         assert result.is_range is True
         assert result.value == ["2024-01-12", "2024-01-15"]
 
     def test_past_two_weeks(self, parser, fixed_now):
         """Test '过去两周' → [14 days ago, today]."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("过去两周")
         assert result.is_range is True
         assert result.value == ["2024-01-01", "2024-01-15"]
 
     def test_recent_two_months(self, parser, fixed_now):
         """Test '最近两个月' → [2 months ago 1st, today]."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("最近两个月")
         assert result.is_range is True
         assert result.value == ["2023-11-01", "2024-01-15"]
 
     def test_recent_half_month(self, parser, fixed_now):
         """Test '最近半个月' → [15 days ago, today]."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("最近半个月")
         assert result.is_range is True
         assert result.value == ["2023-12-31", "2024-01-15"]
@@ -349,24 +326,20 @@ class TestRecentPeriod:
 class TestLunarHolidays:
     """Test cases for lunar calendar holidays."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return FuzzyTimeParser(timezone="Asia/Shanghai")
-
     @pytest.fixture
     def fixed_now(self):
         """Fixed datetime for consistent testing."""
         return datetime(2024, 1, 15, 10, 30, 0, tzinfo=ZoneInfo("Asia/Shanghai"))
 
-    def set_fixed_time(self, parser, fixed_now):
-        """Helper to set fixed time on parser."""
-        parser._now = fixed_now
-        parser.reset_now = lambda: None
+    @pytest.fixture
+    def parser(self, fixed_now):
+        """Create a parser instance pinned to the fixed time."""
+        parser = FuzzyTimeParser(timezone="Asia/Shanghai")
+        with parser.freeze_now(fixed_now):
+            yield parser
 
     def test_parse_spring_festival(self, parser, fixed_now):
         """Test parsing '春节' (Chinese New Year 2024 is Feb 10)."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("春节")
         # Spring Festival 2024: Feb 10
         assert result.is_range is True
@@ -375,14 +348,30 @@ class TestLunarHolidays:
 
     def test_parse_mid_autumn(self, parser, fixed_now):
         """Test parsing '中秋节'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("中秋节")
         # Mid-Autumn Festival 2024 is Sept 17
         assert result.confidence == 0.95
 
     def test_parse_dragon_boat(self, parser, fixed_now):
         """Test parsing '端午节'."""
-        self.set_fixed_time(parser, fixed_now)
         result = parser.parse("端午节")
         assert result.is_range is True
         assert result.confidence == 0.95
+
+    def test_parse_spring_festival_mid_string(self, parser):
+        """Test '今年春节' resolves the holiday, not the fallback."""
+        result = parser.parse("今年春节")
+        assert result.is_range is True
+        assert result.confidence == 0.95
+
+    def test_parse_holiday_outranks_relative_month(self, parser):
+        """Test '下个月的中秋节' resolves the holiday, not next month's range."""
+        result = parser.parse("下个月的中秋节")
+        assert result.is_range is False
+        assert result.confidence == 0.95
+
+    def test_parse_range_mid_string_holiday(self, parser):
+        """Test holiday halves of a range still resolve behind a qualifier."""
+        result = parser.parse("今年春节到元宵节")
+        assert result.is_range is True
+        assert result.confidence == 0.95
@@ -5,7 +5,7 @@ Integration tests for MCP server.
 
 import pytest
 
-from mcp_chinese_time.server import _parse_time_handler
+from mcp_chinese_time.server import _parse_time_batch_handler, _parse_time_handler
 
 
 class TestMCPServer:
@@ -78,3 +78,21 @@ class TestMCPServer:
 
         assert result["success"] is True
         assert result["parsed"]["is_range"] is True
+
+    @pytest.mark.asyncio
+    async def test_parse_time_batch(self):
+        """Test batch handler returns one result per expression, in order."""
+        results = await _parse_time_batch_handler(["昨天", "明天", "国庆节期间"])
+
+        assert len(results) == 3
+        assert all(result["success"] is True for result in results)
+        assert results[2]["parsed"]["is_range"] is True
+
+    @pytest.mark.asyncio
+    async def test_parse_time_batch_invalid_timezone(self):
+        """Test batch handler with invalid timezone."""
+        results = await _parse_time_batch_handler(["今天", "明天"], timezone="Invalid/Timezone")
+
+        assert len(results) == 2
+        assert all(result["success"] is False for result in results)
+        assert all(result["error"] is not None for result in results)